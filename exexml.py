@@ -1,68 +1,298 @@
 import os
+import shlex
 import subprocess
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from lxml import etree as ET
 import json
-import hashlib
+import logging
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+# Separator used to store (name, path) auto-close keys as JSON object keys
+_KEY_SEP = "\x1f"
+
+# <Disabled> values (lower-cased) that mean the addon is disabled
+_TRUTHY_DISABLED = frozenset({"true", "1", "yes"})
+
+# Launched addons get their own process group and no inherited console, so
+# they outlive the manager and never tie up its console handle
+if os.name == "nt":
+    _CREATION_FLAGS = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+else:
+    _CREATION_FLAGS = 0
+
+# Compiled once and reused for every parse_entries() call
+_ADDON_XPATH = ET.XPath("//Launch.Addon")
+_ALT_ADDON_XPATH = ET.XPath("//Addon")
+
+
+def _split_args(args):
+    """Split a CommandLine into argv for non-Windows launches.
+
+    Quotes group words, also mid-token as in --config="...", and backslashes
+    are kept literally, like Windows paths expect.
+    """
+    if not args:
+        return []
+    lexer = shlex.shlex(args, posix=True)
+    lexer.whitespace_split = True
+    lexer.commenters = ""
+    lexer.escape = ""
+    try:
+        return list(lexer)
+    except ValueError:
+        # Unbalanced quotes - fall back to plain whitespace splitting
+        return args.split()
+
+
+def _child(elem, *tags):
+    """Return the first child matching one of tags, creating the first tag if none exist"""
+    for tag in tags:
+        child = elem.find(tag)
+        if child is not None:
+            return child
+    return ET.SubElement(elem, tags[0])
+
+
+def _normalize_fields(name, path, args):
+    """Name, Path and CommandLine values as from_elem reads them back from the XML"""
+    return (name or "").strip(), (path or "").strip(), (args or "").strip()
+
+
+def _disabled_text(enabled):
+    """Value for the <Disabled> element"""
+    return "False" if enabled else "True"
+
+
+def _read_preset_json(path):
+    """Parse a preset file, using orjson when it is installed"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _file_stamp(path):
+    """(mtime_ns, size) of a file, or None if it can't be stat'ed"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _preset_cache_path(path):
+    """Binary sidecar derived from a preset JSON file"""
+    return os.path.splitext(path)[0] + ".msgpk"
+
+
+def _read_preset(path):
+    """Load preset data, preferring an up-to-date msgpack sidecar over the JSON"""
+    if msgpack is not None:
+        try:
+            with open(_preset_cache_path(path), 'rb') as f:
+                cached = msgpack.unpackb(f.read())
+            # The sidecar records the stamp of the JSON it was built from
+            if isinstance(cached, dict) and cached.get("stamp") == list(_file_stamp(path) or ()):
+                return cached["data"]
+        except (OSError, ValueError, KeyError):
+            # Missing or unreadable cache - fall back to the JSON source
+            pass
+
+    data = _read_preset_json(path)
+    _write_preset_cache(path, data)
+    return data
+
+
+def _write_preset_cache(path, data):
+    """Refresh the msgpack sidecar for a preset (best effort); call after the JSON is written"""
+    if msgpack is None:
+        return
+    stamp = _file_stamp(path)
+    if stamp is None:
+        return
+    try:
+        with open(_preset_cache_path(path), 'wb') as f:
+            f.write(msgpack.packb({"stamp": list(stamp), "data": data}))
+    except OSError as e:
+        logger.warning("Could not write preset cache for %s: %s", path, e)
+
+
+def _write_preset_json(path, data):
+    """Write a preset file with 2-space indentation, using orjson when it is installed"""
+    # The preset folder may have been deleted since it was first created
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
 
 class AppEntry:
-    def __init__(self, elem, auto_close_settings=None):
+    __slots__ = ("name", "path", "args", "enabled", "elem", "auto_close", "_resolved_path")
+
+    def __init__(self, name, path, args, enabled, elem=None, auto_close=False):
+        self.name = name
+        self.path = path
+        self.args = args
+        self.enabled = enabled
         self.elem = elem
-        self.name = elem.findtext("Name", "").strip()
-        self.path = elem.findtext("Path", "").strip()
-        
-        # Handle both self-closing CommandLine tags and regular ones
-        cmd_elem = elem.find("CommandLine")
-        if cmd_elem is not None:
-            # Check if it's a self-closing tag or has text content
-            self.args = cmd_elem.text if cmd_elem.text else ""
-        else:
-            # Fallback to Args if CommandLine doesn't exist
-            self.args = elem.findtext("Args", "")
+        self.auto_close = auto_close
+        self._resolved_path = None
+
+    @classmethod
+    def from_elem(cls, elem, auto_close_settings=None):
+        """Build an entry from a Launch.Addon element"""
+        # Single pass over the children; the first occurrence of each tag wins,
+        # matching findtext(). CommandLine takes precedence over the Args fallback.
+        name = path = cmd = fallback_args = disabled = None
+        for child in elem:
+            tag = child.tag
+            if tag == "Name":
+                if name is None:
+                    name = child.text or ""
+            elif tag == "Path":
+                if path is None:
+                    path = child.text or ""
+            elif tag == "CommandLine":
+                # Handle both self-closing CommandLine tags and regular ones
+                if cmd is None:
+                    cmd = child.text or ""
+            elif tag == "Args":
+                if fallback_args is None:
+                    fallback_args = child.text or ""
+            elif tag == "Disabled":
+                if disabled is None:
+                    disabled = child.text or ""
         
-        self.args = self.args.strip()
+        name, path, args = _normalize_fields(name, path, cmd if cmd is not None else fallback_args)
+        enabled = disabled is None or disabled.lower() not in _TRUTHY_DISABLED
         
-        disabled = elem.findtext("Disabled", "False")
-        self.enabled = disabled.lower() not in ["true", "1", "yes"]
+        entry = cls(name, path, args, enabled, elem)
         
         # Auto-close functionality (stored separately, NOT in XML)
-        entry_id = self._generate_entry_id()
-        if auto_close_settings and entry_id in auto_close_settings:
-            self.auto_close = auto_close_settings[entry_id]
-        else:
-            self.auto_close = False
+        if auto_close_settings:
+            entry.auto_close = auto_close_settings.get(entry._generate_entry_id(), False)
+        return entry
     
+    @property
+    def resolved_path(self):
+        """Executable path with environment variables expanded (cached until path changes)"""
+        if self._resolved_path is None:
+            # normpath("") is ".", which would pass an os.path.exists() check
+            self._resolved_path = os.path.normpath(os.path.expandvars(self.path)) if self.path else ""
+        return self._resolved_path
+
     def _generate_entry_id(self):
         """Generate a unique ID for this entry based on name and path"""
-        unique_string = f"{self.name}|{self.path}"
-        return hashlib.md5(unique_string.encode()).hexdigest()
+        return (self.name, self.path)
 
 class ExeXmlManager:
     def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget the loaded file and all entries, as if newly constructed"""
         self.tree = None
         self.root = None
         self.entries = []
         self.filepath = None
+        self._file_stamp = None  # _file_stamp() of filepath as last loaded/saved by us
+        self._dirty = False  # Unsaved changes to the XML tree
         self.auto_close_settings = {}  # Store auto-close settings separately
         self.auto_close_file = None
+        self._auto_close_dirty = False
+        self._legacy_auto_close_settings = {}  # MD5-keyed values from older files
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Persist a batch of mutations with a single write
+        if exc_type is None:
+            self.flush()
+        return False
 
     def load(self, filepath):
+        # Parse first so a missing/invalid file leaves the current state untouched.
+        # Opening it ourselves surfaces a missing file as FileNotFoundError (lxml raises plain OSError)
+        with open(filepath, 'rb') as f:
+            tree = ET.parse(f)
         self.filepath = filepath
-        self.tree = ET.parse(filepath)
-        self.root = self.tree.getroot()
+        self._file_stamp = _file_stamp(filepath)
+        self._dirty = False
+        self.tree = tree
+        self.root = tree.getroot()
         
         # Load auto-close settings from separate file
         self._load_auto_close_settings()
         
-        # Debug: Print XML structure
-        print(f"Root tag: {self.root.tag}")
-        print("All child elements:")
-        for child in self.root:
-            print(f"  - {child.tag}")
-            for grandchild in child:
-                print(f"    - {grandchild.tag}")
+        # Debug: Log XML structure
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Root tag: %s", self.root.tag)
+            logger.debug("All child elements:")
+            for child in self.root:
+                logger.debug("  - %s", child.tag)
+                for grandchild in child:
+                    logger.debug("    - %s", grandchild.tag)
         
         self.parse_entries()
+        self._migrate_legacy_auto_close_settings()
+
+    def is_loaded(self, filepath):
+        """True if filepath is already loaded, has no unsaved changes and is unchanged on disk"""
+        if self.tree is None or not self.filepath or self._dirty or self._auto_close_dirty:
+            return False
+        if os.path.normcase(os.path.abspath(filepath)) != os.path.normcase(os.path.abspath(self.filepath)):
+            return False
+        return self._file_stamp is not None and self._file_stamp == _file_stamp(filepath)
+
+    def load_streaming(self, filepath):
+        """Read-only load of a large exe.xml without keeping the DOM in memory.
+
+        Entries are built as each Launch.Addon closes and the element is then
+        released, so they carry no XML back-reference and cannot be saved.
+        """
+        # Build into a local list so a missing/invalid file leaves the current state untouched
+        entries = []
+        with open(filepath, 'rb') as f:
+            for _, elem in ET.iterparse(f, events=("end",), tag="Launch.Addon"):
+                entry = AppEntry.from_elem(elem)
+                entry.elem = None
+                entries.append(entry)
+
+                # Free this element and any already-processed siblings
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+        self.filepath = filepath
+        self._file_stamp = None
+        self._dirty = False
+        self.tree = None
+        self.root = None
+        self.entries = entries
+
+        # Auto-close settings live next to the new file, so apply them once it parsed
+        self._load_auto_close_settings()
+        for entry in entries:
+            entry.auto_close = self.auto_close_settings.get(entry._generate_entry_id(), False)
+
+        self._migrate_legacy_auto_close_settings()
+        logger.debug("Total entries loaded: %d", len(self.entries))
 
     def _load_auto_close_settings(self):
         """Load auto-close settings from a separate JSON file"""
@@ -73,27 +303,68 @@ class ExeXmlManager:
         base_name = os.path.splitext(os.path.basename(self.filepath))[0]
         dir_name = os.path.dirname(self.filepath)
         self.auto_close_file = os.path.join(dir_name, f"{base_name}_autoclose.json")
+        self._auto_close_dirty = False
+        self.auto_close_settings = {}
+        self._legacy_auto_close_settings = {}
         
         try:
             if os.path.exists(self.auto_close_file):
                 with open(self.auto_close_file, 'r', encoding='utf-8') as f:
-                    self.auto_close_settings = json.load(f)
-            else:
-                self.auto_close_settings = {}
+                    stored = json.load(f)
+                for key, value in stored.items():
+                    if _KEY_SEP in key:
+                        self.auto_close_settings[tuple(key.split(_KEY_SEP, 1))] = value
+                    else:
+                        self._legacy_auto_close_settings[key] = value
         except Exception as e:
-            print(f"Error loading auto-close settings: {e}")
+            logger.error("Error loading auto-close settings: %s", e)
             self.auto_close_settings = {}
+            self._legacy_auto_close_settings = {}
+
+    def _migrate_legacy_auto_close_settings(self):
+        """Re-key auto-close values saved by older versions under an MD5 of name|path"""
+        if not self._legacy_auto_close_settings:
+            return
+        
+        import hashlib  # only needed for this one-off migration
+        
+        for entry in self.entries:
+            legacy_id = hashlib.md5(f"{entry.name}|{entry.path}".encode()).hexdigest()
+            if legacy_id in self._legacy_auto_close_settings:
+                entry.auto_close = self._legacy_auto_close_settings[legacy_id]
+                self._set_auto_close_setting(entry._generate_entry_id(), entry.auto_close)
+        
+        # Unmatched legacy keys belonged to entries that no longer exist
+        self._legacy_auto_close_settings = {}
+        self._auto_close_dirty = True
 
     def _save_auto_close_settings(self):
-        """Save auto-close settings to separate JSON file"""
-        if not self.auto_close_file:
+        """Save auto-close settings to separate JSON file (only when changed)"""
+        if not self.auto_close_file or not self._auto_close_dirty:
             return
             
         try:
-            with open(self.auto_close_file, 'w', encoding='utf-8') as f:
-                json.dump(self.auto_close_settings, f, indent=2)
+            # Write to a temp file and swap it in so a failed write can't truncate the settings
+            tmp_file = self.auto_close_file + ".tmp"
+            stored = {_KEY_SEP.join(key): value for key, value in self.auto_close_settings.items()}
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(stored, f, separators=(",", ":"))
+            os.replace(tmp_file, self.auto_close_file)
+            self._auto_close_dirty = False
         except Exception as e:
-            print(f"Error saving auto-close settings: {e}")
+            logger.error("Error saving auto-close settings: %s", e)
+
+    def _set_auto_close_setting(self, entry_id, auto_close):
+        """Store an auto-close value, marking the settings dirty if it changed"""
+        if self.auto_close_settings.get(entry_id) != auto_close:
+            self.auto_close_settings[entry_id] = auto_close
+            self._auto_close_dirty = True
+
+    def _remove_auto_close_setting(self, entry_id):
+        """Drop an auto-close value, marking the settings dirty if it existed"""
+        if entry_id in self.auto_close_settings:
+            del self.auto_close_settings[entry_id]
+            self._auto_close_dirty = True
 
     def load_preset(self, preset_path):
         """Load a preset file (JSON format) and apply it to current exe.xml"""
@@ -101,14 +372,15 @@ class ExeXmlManager:
             raise FileNotFoundError(f"Preset file not found: {preset_path}")
         
         try:
-            with open(preset_path, 'r', encoding='utf-8') as f:
-                preset_data = json.load(f)
+            preset_data = _read_preset(preset_path)
             
-            # Clear existing entries
-            if self.root is not None:
-                # Remove all Launch.Addon elements
-                for addon in self.root.findall(".//Launch.Addon"):
-                    self.root.remove(addon)
+            # Clear existing entries, detaching the elements we already hold
+            # rather than searching the tree for them again
+            for entry in self.entries:
+                if entry.elem is not None:
+                    entry.elem.getparent().remove(entry.elem)
+                    self._dirty = True
+            self.entries = []
             
             # Add entries from preset
             for entry_data in preset_data.get("entries", []):
@@ -120,7 +392,7 @@ class ExeXmlManager:
                     entry_data.get("auto_close", False)
                 )
             
-            print(f"Loaded preset with {len(preset_data.get('entries', []))} entries")
+            logger.debug("Loaded preset with %d entries", len(preset_data.get("entries", [])))
             
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid preset file format: {e}")
@@ -141,8 +413,24 @@ class ExeXmlManager:
                 "auto_close": entry.auto_close
             })
         
-        with open(preset_path, 'w', encoding='utf-8') as f:
-            json.dump(preset_data, f, indent=2)
+        _write_preset_json(preset_path, preset_data)
+        _write_preset_cache(preset_path, preset_data)
+
+    @staticmethod
+    def delete_preset(preset_path):
+        """Delete a preset file along with its binary cache, if any"""
+        os.remove(preset_path)
+        cache_path = _preset_cache_path(preset_path)
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+
+    @staticmethod
+    def duplicate_preset(src_path, dst_path, new_name):
+        """Copy a preset under a new name, refreshing the copy's binary cache"""
+        preset_data = _read_preset(src_path)
+        preset_data["name"] = new_name
+        _write_preset_json(dst_path, preset_data)
+        _write_preset_cache(dst_path, preset_data)
 
     def parse_entries(self):
         self.entries = []
@@ -157,55 +445,55 @@ class ExeXmlManager:
         #   </Launch.Addon>
         # </SimBase.Document>
         
-        # Try different possible tag patterns for MSFS exe.xml
-        possible_tags = [
-            "Launch.Addon",           # Direct children
-            ".//Launch.Addon",        # Anywhere in document
-            ".//Addon",               # Alternative naming
-            "./Launch.Addon",         # Direct children only
-        ]
-        
-        for tag_pattern in possible_tags:
-            elements = self.root.findall(tag_pattern)
-            print(f"Found {len(elements)} elements with pattern '{tag_pattern}'")
+        # Launch.Addon anywhere in the document, falling back to the
+        # alternative Addon naming
+        for addon_xpath in (_ADDON_XPATH, _ALT_ADDON_XPATH):
+            elements = addon_xpath(self.root)
+            logger.debug("Found %d elements with pattern '%s'", len(elements), addon_xpath.path)
             if elements:
+                debug = logger.isEnabledFor(logging.DEBUG)
                 for elem in elements:
-                    print(f"  Element: {elem.tag}")
-                    print(f"    Name: {elem.findtext('Name', 'N/A')}")
-                    print(f"    Path: {elem.findtext('Path', 'N/A')}")
-                    print(f"    CommandLine: {elem.findtext('CommandLine', 'N/A')}")
-                    print(f"    Args: {elem.findtext('Args', 'N/A')}")
-                    self.entries.append(AppEntry(elem, self.auto_close_settings))
+                    if debug:
+                        logger.debug("  Element: %s", elem.tag)
+                        logger.debug("    Name: %s", elem.findtext("Name", "N/A"))
+                        logger.debug("    Path: %s", elem.findtext("Path", "N/A"))
+                        logger.debug("    CommandLine: %s", elem.findtext("CommandLine", "N/A"))
+                        logger.debug("    Args: %s", elem.findtext("Args", "N/A"))
+                    self.entries.append(AppEntry.from_elem(elem, self.auto_close_settings))
                 break  # Use the first pattern that finds elements
         
-        print(f"Total entries loaded: {len(self.entries)}")
+        logger.debug("Total entries loaded: %d", len(self.entries))
+
+    def auto_close_names(self):
+        """Names of enabled entries that should close with the simulator"""
+        return [e.name for e in self.entries if e.enabled and e.auto_close]
 
     def save(self):
         if self.tree is not None and self.filepath:
             # Format the XML with proper indentation
-            self._indent_xml(self.root)
+            ET.indent(self.root, space="  ", level=0)
             self.tree.write(self.filepath, encoding="utf-8", xml_declaration=True)
+            self._file_stamp = _file_stamp(self.filepath)
+            self._dirty = False
             
             # Save auto-close settings separately
             self._save_auto_close_settings()
-    
-    def _indent_xml(self, elem, level=0):
-        """Add proper indentation to XML elements"""
-        indent = "\n" + level * "  "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = indent + "  "
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = indent
-            for child in elem:
-                self._indent_xml(child, level + 1)
-            if not child.tail or not child.tail.strip():
-                child.tail = indent
-        else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = indent
+
+    @property
+    def dirty(self):
+        """True if the XML tree has changes that haven't been written to exe.xml"""
+        return self._dirty
+
+    def flush(self):
+        """Save only what has unsaved changes; exe.xml itself is only rewritten for XML changes"""
+        if self._dirty:
+            self.save()
+        elif self._auto_close_dirty:
+            self._save_auto_close_settings()
 
     def add_entry(self, name, path, args, enabled=True, auto_close=False):
+        name, path, args = _normalize_fields(name, path, args)
+
         # Try to find the correct parent element or create the structure
         launch_parent = self.root.find(".//SimBase.Document")
         if launch_parent is None:
@@ -215,48 +503,59 @@ class ExeXmlManager:
         ET.SubElement(addon, "Name").text = name
         ET.SubElement(addon, "Path").text = path
         ET.SubElement(addon, "CommandLine").text = args
-        ET.SubElement(addon, "Disabled").text = "False" if enabled else "True"
+        ET.SubElement(addon, "Disabled").text = _disabled_text(enabled)
         launch_parent.append(addon)
         
         # Store auto-close setting separately
-        entry_id = hashlib.md5(f"{name}|{path}".encode()).hexdigest()
-        self.auto_close_settings[entry_id] = auto_close
+        self._set_auto_close_setting((name, path), auto_close)
         
-        self.parse_entries()
+        self.entries.append(AppEntry.from_elem(addon, self.auto_close_settings))
+        self._dirty = True
 
     def remove_entry(self, index):
         entry = self.entries[index]
         
         # Remove auto-close setting
-        entry_id = entry._generate_entry_id()
-        if entry_id in self.auto_close_settings:
-            del self.auto_close_settings[entry_id]
+        self._remove_auto_close_setting(entry._generate_entry_id())
         
-        # Instead of entry.elem.getparent(), use self.root (or the parent element you have)
-        self.root.remove(entry.elem)
+        # lxml tracks parents, so entries nested below the root are removed correctly
+        entry.elem.getparent().remove(entry.elem)
         del self.entries[index]
-        self.save()
+        self._dirty = True
 
     def execute_entry(self, index):
         if index < 0 or index >= len(self.entries):
             return None
         entry = self.entries[index]
-        if not os.path.exists(entry.path):
+        exe_path = entry.resolved_path
+        if not os.path.exists(exe_path):
             raise FileNotFoundError(f"Executable not found: {entry.path}")
         
         # Launch the process and return the Popen object for tracking
-        process = subprocess.Popen([entry.path] + entry.args.split())
+        # Many addons expect to be started from their own folder
+        if os.name == "nt":
+            # Hand Windows the CommandLine exactly as written in exe.xml so the
+            # addon's own argument parser sees forms like --config="C:\Program Files\x" intact
+            command = subprocess.list2cmdline([exe_path])
+            if entry.args:
+                command += " " + entry.args
+        else:
+            command = [exe_path, *_split_args(entry.args)]
+        process = subprocess.Popen(
+            command,
+            cwd=os.path.dirname(exe_path) or None,
+            creationflags=_CREATION_FLAGS,
+            close_fds=True,
+        )
         return process
 
     def set_enabled(self, index, enabled: bool):
         if index < 0 or index >= len(self.entries):
             return
         entry = self.entries[index]
-        disabled_elem = entry.elem.find("Disabled")
-        if disabled_elem is None:
-            disabled_elem = ET.SubElement(entry.elem, "Disabled")
-        disabled_elem.text = "False" if enabled else "True"
-        self.parse_entries()
+        _child(entry.elem, "Disabled").text = _disabled_text(enabled)
+        entry.enabled = enabled
+        self._dirty = True
     
     def set_auto_close(self, index, auto_close: bool):
         """Set auto-close setting for an entry"""
@@ -264,8 +563,7 @@ class ExeXmlManager:
             return
         
         entry = self.entries[index]
-        entry_id = entry._generate_entry_id()
-        self.auto_close_settings[entry_id] = auto_close
+        self._set_auto_close_setting(entry._generate_entry_id(), auto_close)
         
         # Update the entry object
         entry.auto_close = auto_close
@@ -276,29 +574,31 @@ class ExeXmlManager:
         
         entry = self.entries[index]
         old_entry_id = entry._generate_entry_id()
+        # Store exactly what a reload would produce, so the auto-close key survives it
+        name, path, args = _normalize_fields(name, path, args)
         
         # Update XML elements
-        entry.elem.find("Name").text = name
-        entry.elem.find("Path").text = path
-        cmd_elem = entry.elem.find("CommandLine")
-        if cmd_elem is None:
-            cmd_elem = entry.elem.find("Args")
-        if cmd_elem is None:
-            cmd_elem = ET.SubElement(entry.elem, "CommandLine")
-        cmd_elem.text = args
-        disabled_elem = entry.elem.find("Disabled")
-        if disabled_elem is None:
-            disabled_elem = ET.SubElement(entry.elem, "Disabled")
-        disabled_elem.text = "False" if enabled else "True"
+        _child(entry.elem, "Name").text = name
+        _child(entry.elem, "Path").text = path
+        _child(entry.elem, "CommandLine", "Args").text = args
+        _child(entry.elem, "Disabled").text = _disabled_text(enabled)
         
         # Handle auto-close setting change
-        new_entry_id = hashlib.md5(f"{name}|{path}".encode()).hexdigest()
+        new_entry_id = (name, path)
         
         # Remove old auto-close setting if entry ID changed
-        if old_entry_id != new_entry_id and old_entry_id in self.auto_close_settings:
-            del self.auto_close_settings[old_entry_id]
+        if old_entry_id != new_entry_id:
+            self._remove_auto_close_setting(old_entry_id)
         
         # Set new auto-close setting
-        self.auto_close_settings[new_entry_id] = auto_close
+        self._set_auto_close_setting(new_entry_id, auto_close)
         
-        self.parse_entries()
\ No newline at end of file
+        # Update the entry object in place instead of reparsing the tree
+        entry.name = name
+        if path != entry.path:
+            entry.path = path
+            entry._resolved_path = None
+        entry.args = args
+        entry.enabled = enabled
+        entry.auto_close = auto_close
+        self._dirty = True
\ No newline at end of file
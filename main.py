@@ -1,34 +1,29 @@
 import sys
 import os
 import argparse
-import xml.etree.ElementTree as ET
+from datetime import datetime
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, 
-    QTableWidget, QTableWidgetItem, QPushButton, QComboBox, QLabel,
+    QTableView, QPushButton, QComboBox, QLabel,
     QFileDialog, QMessageBox, QAbstractItemView, QInputDialog, QFrame,
-    QHeaderView, QSpacerItem, QSizePolicy, QMenu, QMenuBar, QCheckBox,
-    QSystemTrayIcon
+    QHeaderView, QSystemTrayIcon
 )
-from PySide6.QtCore import Qt, QSize, QTimer
-from PySide6.QtGui import QFont, QIcon, QPalette, QColor, QAction, QCloseEvent
+from PySide6.QtCore import QTimer, QFileSystemWatcher, QUrl
+from PySide6.QtGui import QIcon, QAction, QCloseEvent, QDesktopServices
 from exexml import ExeXmlManager
-from views.add_edit_dialog import AddEditDialog
+from views.entries_model import EntriesModel
 from process_monitor import ProcessMonitor
 from single_instance import SingleInstanceManager
 from system_tray import SystemTrayManager
 import settings
-from PySide6.QtGui import QIcon
-import json
+
+# PyInstaller creates a temp folder and stores path in _MEIPASS; resolved once at import
+_RESOURCE_BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.abspath(".")
+
 
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_RESOURCE_BASE_PATH, relative_path)
 
 class BackupDialog(QMessageBox):
     def __init__(self, exe_xml_path, sim_version, parent=None):
@@ -66,6 +61,9 @@ class BackupDialog(QMessageBox):
         self.setDefaultButton(self.buttons()[0])
 
 
+_BACKUP_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
 class BackupManagerDialog(QMessageBox):
     def __init__(self, sim_version, parent=None):
         super().__init__(parent)
@@ -79,23 +77,24 @@ class BackupManagerDialog(QMessageBox):
             self.setText("No backups found for this simulator version.")
             self.setStandardButtons(QMessageBox.Ok)
         else:
-            text = f"<b>Found {len(backups)} backup(s) for {sim_version}:</b><br><br>"
+            lines = [f"<b>Found {len(backups)} backup(s) for {sim_version}:</b><br><br>"]
             
-            from datetime import datetime
             for i, (filename, full_path, creation_time) in enumerate(backups[:10], 1):  # Show max 10
-                dt = datetime.fromtimestamp(creation_time)
+                created = datetime.fromtimestamp(creation_time).strftime(_BACKUP_TIME_FORMAT)
                 # Extract install type from filename
                 parts = filename.replace("exe_xml_backup_", "").replace(".xml", "").split("_")
                 install_type = " ".join(parts[:-2]) if len(parts) > 2 else "Unknown"
                 
-                text += f"{i}. <b>{install_type}</b><br>"
-                text += f"   Created: {dt.strftime('%Y-%m-%d %H:%M:%S')}<br>"
-                text += f"   File: {filename}<br><br>"
+                lines.append(
+                    f"{i}. <b>{install_type}</b><br>"
+                    f"   Created: {created}<br>"
+                    f"   File: {filename}<br><br>"
+                )
             
             if len(backups) > 10:
-                text += f"... and {len(backups) - 10} more backups"
+                lines.append(f"... and {len(backups) - 10} more backups")
             
-            self.setText(text)
+            self.setText("".join(lines))
             
             # Add buttons for backup actions
             self.addButton("Open Backup Folder", QMessageBox.ActionRole)
@@ -117,19 +116,18 @@ class DetectedPathDialog(QMessageBox):
             self.setStandardButtons(QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel)
             self.setDefaultButton(QMessageBox.Yes)
         else:
-            text = f"Found {len(detected_paths)} exe.xml files:\n\n"
-            for i, (description, path) in enumerate(detected_paths, 1):
-                installation_type = settings.get_installation_type(path)
-                text += f"{i}. {description} ({installation_type})\n   {path}\n\n"
-            
-            text += "Which one would you like to load?"
-            self.setText(text)
+            labels = [
+                (f"{description} ({settings.get_installation_type(path)})", path)
+                for description, path in detected_paths
+            ]
+            parts = [f"Found {len(detected_paths)} exe.xml files:\n\n"]
+            parts.extend(f"{i}. {label}\n   {path}\n\n" for i, (label, path) in enumerate(labels, 1))
+            parts.append("Which one would you like to load?")
+            self.setText("".join(parts))
             
             # Add custom buttons for each detected path
-            for i, (description, path) in enumerate(detected_paths):
-                installation_type = settings.get_installation_type(path)
-                button_text = f"{description} ({installation_type})"
-                button = self.addButton(button_text, QMessageBox.AcceptRole)
+            for label, path in labels:
+                button = self.addButton(label, QMessageBox.AcceptRole)
                 button.setProperty("path", path)
             
             self.addButton("Browse...", QMessageBox.RejectRole)
@@ -138,15 +136,10 @@ class DetectedPathDialog(QMessageBox):
 
 class ModernButton(QPushButton):
     def __init__(self, text, icon_text="", primary=False):
-        super().__init__()
-        self.setText(f"{icon_text} {text}".strip())
+        super().__init__(f"{icon_text} {text}" if icon_text else text)
         self.setMinimumHeight(36)
         self.setMinimumWidth(100)
-        
-        if primary:
-            self.setObjectName("primaryButton")
-        else:
-            self.setObjectName("secondaryButton")
+        self.setObjectName("primaryButton" if primary else "secondaryButton")
 
 
 class ModernComboBox(QComboBox):
@@ -181,8 +174,16 @@ class MainWindow(QMainWindow):
         
         # Manager backend
         self.manager = ExeXmlManager()
-        s = settings.load_settings()
-        self.current_version = s.get("version", "MSFS2020")
+        
+        # Settings are read once and kept in memory; changes are written back
+        # shortly after the last modification (see set_setting)
+        self._settings = settings.load_settings()
+        self._dirty_settings = set()
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(500)
+        self._settings_timer.timeout.connect(self.flush_settings)
+        self.current_version = self._settings.get("version", "MSFS2020")
         
         # Process monitoring
         self.process_monitor = ProcessMonitor()
@@ -202,14 +203,39 @@ class MainWindow(QMainWindow):
         # Track active timers for cleanup
         self.active_timers = []
         
+        # Debounced auto-save for checkbox edits in the table
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(200)
+        self._save_timer.timeout.connect(self._flush_save)
+        
+        # Session end / QApplication.quit() can bypass closeEvent; don't drop pending writes then
+        app = QApplication.instance()
+        app.aboutToQuit.connect(self._flush_pending_save)
+        app.aboutToQuit.connect(self.flush_settings)
+        
+        # Resolved preset directory per sim version (see _preset_dir)
+        self._preset_dirs = {}
+        
+        # (version, exe.xml path) pairs known to be backed up, so edits skip the settings lookup
+        self._backed_up_files = set()
+        
+        # Add/modify dialog, built on first use and reused afterwards (see _entry_dialog)
+        self._add_edit_dialog = None
+        
         # Setup UI
         self.setup_ui()
         
+        # Refresh the preset list whenever files are added/removed in the preset directory
+        self.preset_watcher = QFileSystemWatcher([self._preset_dir()], self)
+        self.preset_watcher.directoryChanged.connect(self.refresh_presets)
+        
         # Initialize
         self.refresh_presets()
         
-        # Auto load with detection
-        self.auto_load_exe()
+        # Auto load with detection once the event loop is running, so the window paints first
+        self.update_status("Detecting exe.xml...")
+        QTimer.singleShot(0, self.auto_load_exe)
         
         # Start process monitoring
         self.process_monitor.start_monitoring(self.current_version)
@@ -283,7 +309,9 @@ class MainWindow(QMainWindow):
         print("\n=== Force Complete Shutdown ===")
         
         try:
-            # Stop all timers first
+            # Write any pending auto-save and settings changes, then stop all timers
+            self._flush_pending_save()
+            self.flush_settings()
             self.stop_all_timers()
             
             # Stop process monitoring immediately
@@ -303,7 +331,6 @@ class MainWindow(QMainWindow):
         except Exception as e:
             print(f"Error during force shutdown: {e}")
             # Force exit regardless of errors
-            import os
             os._exit(0)
         
         print("=== Force Complete Shutdown Complete ===\n")
@@ -524,19 +551,23 @@ class MainWindow(QMainWindow):
         return layout
 
     def create_table(self):
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)  # Added Auto-Close column
-        self.table.setHorizontalHeaderLabels(["Enabled", "Name", "Path", "Arguments", "Auto-Close"])
+        # The model reads straight from manager.entries; the view only asks for visible rows
+        self.entries_model = EntriesModel(self.manager, self)
+        self.entries_model.checkToggled.connect(self.on_check_toggled)
+        
+        self.table = QTableView()
+        self.table.setModel(self.entries_model)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setAlternatingRowColors(True)
         self.table.setShowGrid(False)
-        self.table.itemChanged.connect(self.on_item_changed)
         
         # Modern table styling
         self.table.setObjectName("modernTable")
         
         # Header styling
         header = self.table.horizontalHeader()
+        # Any content-based sizing only samples the visible rows, never the whole column
+        header.setResizeContentsPrecision(0)
         header.setDefaultSectionSize(200)
         header.setSectionResizeMode(0, QHeaderView.Fixed)
         header.setSectionResizeMode(1, QHeaderView.Interactive)
@@ -544,14 +575,14 @@ class MainWindow(QMainWindow):
         header.setSectionResizeMode(3, QHeaderView.Interactive)
         header.setSectionResizeMode(4, QHeaderView.Fixed)
         
-        # Set column widths
-        self.table.setColumnWidth(0, 80)   # Enabled
-        self.table.setColumnWidth(1, 200)  # Name
-        self.table.setColumnWidth(3, 150)  # Arguments
-        self.table.setColumnWidth(4, 90)   # Auto-Close
+        # Set column widths (Name keeps the 200px default, Path stretches)
+        header.resizeSection(0, 80)   # Enabled
+        header.resizeSection(3, 150)  # Arguments
+        header.resizeSection(4, 90)   # Auto-Close
         
         # Row height
         self.table.verticalHeader().setDefaultSectionSize(40)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.table.verticalHeader().hide()
 
     def create_status(self):
@@ -565,6 +596,8 @@ class MainWindow(QMainWindow):
         
         # Installation type label
         self.install_type_label = QLabel("")
+        self._status_filepath = None  # filepath install_type_label currently describes
+        self._status_count = -1  # entry count entries_count_label currently shows
         self.install_type_label.setObjectName("statusLabel")
         
         layout.addWidget(self.status_label)
@@ -577,16 +610,61 @@ class MainWindow(QMainWindow):
     def update_status(self, message="Ready"):
         self.status_label.setText(message)
         count = len(self.manager.entries)
-        self.entries_count_label.setText(f"{count} {'entry' if count == 1 else 'entries'}")
+        if count != self._status_count:
+            self._status_count = count
+            self.entries_count_label.setText(f"{count} {'entry' if count == 1 else 'entries'}")
         
-        # Update installation type if file is loaded
-        if self.manager.filepath:
-            install_type = settings.get_installation_type(self.manager.filepath)
+        # Update installation type only when the loaded file changed
+        filepath = self.manager.filepath
+        if filepath == self._status_filepath:
+            return
+        self._status_filepath = filepath
+        if filepath:
+            install_type = settings.get_installation_type(filepath)
             # Show both the install type and the actual path for debugging
-            self.install_type_label.setText(f"• {install_type} | Path: {self.manager.filepath}")
+            self.install_type_label.setText(f"• {install_type} | Path: {filepath}")
         else:
             self.install_type_label.setText("")
 
+    def _preset_dir(self):
+        """Preset directory for the current sim version, resolved once per version.
+
+        The folder may be deleted while the app runs: get_presets then lists nothing
+        and preset writes recreate it.
+        """
+        path = self._preset_dirs.get(self.current_version)
+        if path is None:
+            path = settings.get_preset_dir(self.current_version)
+            self._preset_dirs[self.current_version] = path
+        return path
+
+    def _preset_path(self, name):
+        """Path of the named preset file for the current sim version"""
+        return os.path.join(self._preset_dir(), name + ".json")
+
+    def set_setting(self, key, value):
+        """Update a setting in memory and schedule it to be written to disk"""
+        self._settings[key] = value
+        self._dirty_settings.add(key)
+        self._settings_timer.start()  # Restarting coalesces rapid changes into one write
+
+    def flush_settings(self):
+        """Write pending setting changes to disk immediately"""
+        self._settings_timer.stop()
+        if not self._dirty_settings:
+            return
+        
+        # Merge into the file's current contents so keys written elsewhere
+        # (e.g. backed_up_files by settings.mark_file_as_backed_up) are kept
+        try:
+            s = settings.load_settings()
+            for key in self._dirty_settings:
+                s[key] = self._settings[key]
+            settings.save_settings(s)
+            self._dirty_settings.clear()
+        except Exception as e:
+            print(f"Error saving settings: {e}")
+
     def stop_all_timers(self):
         """Stop all QTimer instances"""
         try:
@@ -616,6 +694,10 @@ class MainWindow(QMainWindow):
             # Really exiting or in auto-quit mode
             print("Application closing - performing cleanup...")
             
+            # Write any pending auto-save and settings changes
+            self._flush_pending_save()
+            self.flush_settings()
+            
             # Stop all timers
             self.stop_all_timers()
             
@@ -631,22 +713,24 @@ class MainWindow(QMainWindow):
 
     def auto_load_exe(self):
         """Try to auto-load exe.xml on startup"""
-        s = settings.load_settings()
-        paths = s.get("paths", {})
+        paths = self._settings.get("paths", {})
         
-        # First, try saved path
-        if self.current_version in paths and os.path.exists(paths[self.current_version]):
-            self.load_exe(paths[self.current_version])
-            return
+        # First, try saved path (only a file that has since disappeared falls through to detection)
+        saved_path = paths.get(self.current_version)
+        if saved_path:
+            try:
+                self.load_exe(saved_path, missing_ok=True)
+                return
+            except FileNotFoundError:
+                pass
         
-        # If no saved path, try auto-detection
+        # If no saved path, try auto-detection (load_exe reports its own errors)
         auto_path = settings.auto_detect_exe_xml(self.current_version)
         if auto_path:
-            try:
-                self.load_exe(auto_path)
+            if self.load_exe(auto_path):
                 self.update_status(f"Auto-loaded {os.path.basename(auto_path)}")
-            except Exception as e:
-                self.update_status(f"Auto-detection found file but failed to load: {str(e)}")
+        else:
+            self.update_status()
 
     def auto_detect_exe(self):
         """Manual auto-detection triggered by button"""
@@ -759,23 +843,13 @@ class MainWindow(QMainWindow):
         """Open the backup folder in file explorer"""
         backup_dir = settings.get_backup_dir(self.current_version)
         
-        try:
-            import subprocess
-            import platform
-            
-            if platform.system() == "Windows":
-                subprocess.run(["explorer", backup_dir])
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", backup_dir])
-            else:  # Linux
-                subprocess.run(["xdg-open", backup_dir])
-                
-        except Exception as e:
+        # Hand the folder to the platform shell without spawning and waiting on a process
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(backup_dir)):
             QMessageBox.information(
                 self,
                 "Backup Folder",
                 f"Backup folder location:\n{backup_dir}\n\n"
-                f"(Could not open automatically: {str(e)})"
+                "(Could not open automatically)"
             )
 
     def create_manual_backup(self):
@@ -824,9 +898,11 @@ class MainWindow(QMainWindow):
     # -------------------------
     def change_version(self, version):
         self.current_version = version
-        s = settings.load_settings()
-        s["version"] = version
-        settings.save_settings(s)
+        self.set_setting("version", version)
+        self.preset_watcher.removePaths(self.preset_watcher.directories())
+        self.preset_watcher.addPath(self._preset_dir())
+        # Start from an empty list so the new version's last used preset gets selected
+        self.preset_combo.clear()
         self.refresh_presets()
         self.update_status(f"Switched to {version}")
         
@@ -834,9 +910,12 @@ class MainWindow(QMainWindow):
         self.process_monitor.stop_monitoring()
         self.running_addons.clear()
         
-        # Clear current data
-        self.manager = ExeXmlManager()
-        self.populate_table()
+        # Clear current data (writing any pending auto-save first)
+        self._flush_pending_save()
+        self.entries_model.beginResetModel()
+        self.manager.reset()
+        self.entries_model.endResetModel()
+        self.update_status()
         
         # Try auto-load for new version
         self.auto_load_exe()
@@ -847,21 +926,22 @@ class MainWindow(QMainWindow):
     # -------------------------
     # exe.xml Handling
     # -------------------------
-    def load_exe(self, path=None):
+    def load_exe(self, path=None, missing_ok=False):
+        """Load an exe.xml, prompting for one if no path is given. Returns True on success.
+
+        With missing_ok, a file that does not exist raises FileNotFoundError instead of
+        showing an error dialog, so the caller can fall back to something else.
+        """
         if not path:
             # Get last used directory for file dialog
-            s = settings.load_settings()
-            paths = s.get("paths", {})
+            paths = self._settings.get("paths", {})
             start_dir = ""
             
             if self.current_version in paths and os.path.exists(os.path.dirname(paths[self.current_version])):
                 start_dir = os.path.dirname(paths[self.current_version])
             else:
                 # Use default MSFS directory based on version
-                if self.current_version == "MSFS2020":
-                    start_dir = os.path.expandvars(r"%APPDATA%\Microsoft Flight Simulator")
-                elif self.current_version == "MSFS2024":
-                    start_dir = os.path.expandvars(r"%APPDATA%\Microsoft Flight Simulator 2024")
+                start_dir = settings.DEFAULT_SIM_DIRS.get(self.current_version, "")
                 
                 # Fallback to user's home directory if default doesn't exist
                 if not os.path.exists(start_dir):
@@ -871,23 +951,32 @@ class MainWindow(QMainWindow):
                 self, "Select exe.xml", start_dir, "XML Files (*.xml)"
             )
             if not path:
-                return
+                return False
+        
+        # Re-selecting the file that is already loaded (and unchanged on disk) needs no reparse
+        if self.manager.is_loaded(path):
+            self.update_status(f"Already loaded {os.path.basename(path)}")
+            return True
         
         try:
             # Check if backup is needed for first-time use
             if settings.is_first_time_using_file(path, self.current_version):
+                # A remembered path may be gone; find out before offering to back it up
+                if missing_ok:
+                    open(path, "rb").close()
                 if not self.show_first_time_backup_dialog(path):
-                    return  # User cancelled or backup failed
+                    return False  # User cancelled or backup failed
             
+            self._flush_pending_save()
             self.manager.load(path)
             self.populate_table()
             
-            # Save path in settings
-            s = settings.load_settings()
-            paths = s.get("paths", {})
-            paths[self.current_version] = path
-            s["paths"] = paths
-            settings.save_settings(s)
+            # Save path in settings (skipped when it came from there, e.g. auto_load_exe)
+            paths = self._settings.get("paths", {})
+            if paths.get(self.current_version) != path:
+                paths = dict(paths)
+                paths[self.current_version] = path
+                self.set_setting("paths", paths)
             
             # Update process monitoring for auto-close entries
             self.update_process_monitoring()
@@ -903,10 +992,18 @@ class MainWindow(QMainWindow):
                     f"Loaded {os.path.basename(path)} ({install_type})",
                     QSystemTrayIcon.Information
                 )
+            return True
             
+        except OSError as e:
+            if missing_ok and isinstance(e, FileNotFoundError):
+                raise
+            QMessageBox.critical(self, "Error", str(e))
+            self.update_status("Error loading file")
+            return False
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
             self.update_status("Error loading file")
+            return False
 
     def save_exe(self):
         if not self.manager.filepath:
@@ -915,10 +1012,7 @@ class MainWindow(QMainWindow):
             
         try:
             # Create backup before saving if this is the first save
-            if settings.is_first_time_using_file(self.manager.filepath, self.current_version):
-                backup_created, backup_path, error = settings.auto_backup_if_needed(self.manager.filepath, self.current_version)
-                if backup_created:
-                    self.update_status(f"Backup created: {os.path.basename(backup_path)}")
+            self._backup_before_first_change()
             
             self.manager.save()
             QMessageBox.information(self, "Success", "exe.xml saved successfully.")
@@ -938,11 +1032,11 @@ class MainWindow(QMainWindow):
         
         # Add all auto-close entries to monitoring
         for entry in self.manager.entries:
-            if entry.auto_close and entry.enabled and os.path.exists(entry.path):
-                self.process_monitor.add_addon_to_monitor(entry.name, entry.path)
+            if entry.auto_close and entry.enabled and os.path.exists(entry.resolved_path):
+                self.process_monitor.add_addon_to_monitor(entry.name, entry.resolved_path)
                 self.running_addons[entry.name] = {
                     'process': None,
-                    'path': entry.path,
+                    'path': entry.resolved_path,
                     'auto_close': True
                 }
                 print(f"Added to monitoring: {entry.name} -> {entry.path}")
@@ -957,68 +1051,24 @@ class MainWindow(QMainWindow):
     # Table Handling
     # -------------------------
     def populate_table(self):
-        self.table.blockSignals(True)
-        self.table.setRowCount(len(self.manager.entries))
-        
-        for row, entry in enumerate(self.manager.entries):
-            # Enabled checkbox
-            enabled_item = QTableWidgetItem()
-            enabled_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-            enabled_item.setCheckState(Qt.Checked if entry.enabled else Qt.Unchecked)
-            enabled_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 0, enabled_item)
-            
-            # Name
-            name_item = QTableWidgetItem(entry.name)
-            name_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-            self.table.setItem(row, 1, name_item)
-            
-            # Path
-            path_item = QTableWidgetItem(entry.path)
-            path_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-            path_item.setToolTip(entry.path)
-            self.table.setItem(row, 2, path_item)
-            
-            # Args
-            args_item = QTableWidgetItem(entry.args)
-            args_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-            self.table.setItem(row, 3, args_item)
-            
-            # Auto-Close checkbox
-            auto_close_item = QTableWidgetItem()
-            auto_close_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-            auto_close_item.setCheckState(Qt.Checked if entry.auto_close else Qt.Unchecked)
-            auto_close_item.setTextAlignment(Qt.AlignCenter)
-            auto_close_item.setToolTip("Automatically close this addon when the simulator stops")
-            self.table.setItem(row, 4, auto_close_item)
-        
-        self.table.blockSignals(False)
+        self.entries_model.reset()
         self.update_status()
 
-    def on_item_changed(self, item):
-        row = item.row()
-        
-        if item.column() == 0:  # Enabled checkbox changed
-            enabled = item.checkState() == Qt.Checked
-            
-            # Create backup before first modification if needed
-            if settings.is_first_time_using_file(self.manager.filepath, self.current_version):
-                backup_created, backup_path, error = settings.auto_backup_if_needed(self.manager.filepath, self.current_version)
-                if backup_created:
-                    self.update_status(f"Backup created: {os.path.basename(backup_path)}")
-            
-            self.manager.set_enabled(row, enabled)
+    def on_check_toggled(self, row, column, checked):
+        if column == EntriesModel.ENABLED_COLUMN:
+            # In-memory only; the first-time backup and the write happen once per burst in _flush_save
+            self.manager.set_enabled(row, checked)
             
-        elif item.column() == 4:  # Auto-Close checkbox changed
-            auto_close = item.checkState() == Qt.Checked
+        elif column == EntriesModel.AUTO_CLOSE_COLUMN:
+            auto_close = checked
             
             # Update auto-close setting (stored separately, not in XML)
             self.manager.set_auto_close(row, auto_close)
             
             # Update process monitoring
             entry = self.manager.entries[row]
-            if auto_close and os.path.exists(entry.path):
-                self.process_monitor.add_addon_to_monitor(entry.name, entry.path)
+            if auto_close and os.path.exists(entry.resolved_path):
+                self.process_monitor.add_addon_to_monitor(entry.name, entry.resolved_path)
                 print(f"Added {entry.name} to auto-close monitoring")
             elif not auto_close:
                 self.process_monitor.remove_addon_from_monitor(entry.name)
@@ -1026,8 +1076,23 @@ class MainWindow(QMainWindow):
                     del self.running_addons[entry.name]
                 print(f"Removed {entry.name} from auto-close monitoring")
         
+        # Coalesce bursts of toggles into a single write
+        self._save_timer.start()
+
+    def _flush_pending_save(self):
+        """Write a debounced auto-save now instead of waiting for the timer"""
+        if self._save_timer.isActive():
+            self._flush_save()
+
+    def _flush_save(self):
+        """Write pending checkbox changes to exe.xml"""
+        self._save_timer.stop()
         try:
-            self.manager.save()
+            # Back up the untouched file before the first write of exe.xml changes
+            # (flush() only rewrites exe.xml when the XML tree is dirty)
+            if self.manager.dirty:
+                self._backup_before_first_change()
+            self.manager.flush()
             self.update_status("Auto-saved changes")
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
@@ -1035,26 +1100,43 @@ class MainWindow(QMainWindow):
     # -------------------------
     # Entry Handling
     # -------------------------
+    def _backup_before_first_change(self):
+        """Back up the loaded exe.xml the first time it is about to be modified"""
+        key = (self.current_version, self.manager.filepath)
+        if key in self._backed_up_files:
+            return
+        if settings.is_first_time_using_file(self.manager.filepath, self.current_version):
+            backup_created, backup_path, error = settings.auto_backup_if_needed(self.manager.filepath, self.current_version)
+            if not backup_created:
+                return  # Try again on the next change
+            self.update_status(f"Backup created: {os.path.basename(backup_path)}")
+        self._backed_up_files.add(key)
+
+    def _entry_dialog(self):
+        """The shared add/modify dialog; only built (and its module imported) when first needed"""
+        if self._add_edit_dialog is None:
+            from views.add_edit_dialog import AddEditDialog
+            self._add_edit_dialog = AddEditDialog(self)
+        return self._add_edit_dialog
+
     def add_entry(self):
         if not self.manager.filepath:
             QMessageBox.information(self, "No File Loaded", "Please load an exe.xml file first.")
             return
             
-        dlg = AddEditDialog(self)
+        dlg = self._entry_dialog()
+        dlg.reset("Add Entry")
         if dlg.exec():
             # Create backup before first modification if needed
-            if settings.is_first_time_using_file(self.manager.filepath, self.current_version):
-                backup_created, backup_path, error = settings.auto_backup_if_needed(self.manager.filepath, self.current_version)
-                if backup_created:
-                    self.update_status(f"Backup created: {os.path.basename(backup_path)}")
+            self._backup_before_first_change()
             
             name, path, args, enabled, auto_close = dlg.get_data()
-            self.manager.add_entry(name, path, args, enabled, auto_close)
-            self.populate_table()
+            self.entries_model.append_entry(name, path, args, enabled, auto_close)
             
             # Add to process monitoring if auto-close is enabled
-            if auto_close and os.path.exists(path):
-                self.process_monitor.add_addon_to_monitor(name, path)
+            exe_path = self.manager.entries[-1].resolved_path
+            if auto_close and os.path.exists(exe_path):
+                self.process_monitor.add_addon_to_monitor(name, exe_path)
                 print(f"Added new entry {name} to auto-close monitoring")
             
             self.update_status("Entry added")
@@ -1080,10 +1162,7 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.Yes:
             # Create backup before first modification if needed
-            if settings.is_first_time_using_file(self.manager.filepath, self.current_version):
-                backup_created, backup_path, error = settings.auto_backup_if_needed(self.manager.filepath, self.current_version)
-                if backup_created:
-                    self.update_status(f"Backup created: {os.path.basename(backup_path)}")
+            self._backup_before_first_change()
             
             # Remove from process monitoring if it was being tracked
             entry = self.manager.entries[index]
@@ -1092,8 +1171,8 @@ class MainWindow(QMainWindow):
                 del self.running_addons[entry.name]
                 print(f"Removed {entry.name} from monitoring")
             
-            self.manager.remove_entry(index)
-            self.populate_table()
+            with self.manager:
+                self.entries_model.remove_entry(index)
             self.update_status("Entry removed")
 
     def run_entry(self):
@@ -1118,10 +1197,10 @@ class MainWindow(QMainWindow):
                 
                 if entry.auto_close:
                     # Track this process for auto-closing
-                    self.process_monitor.add_addon_to_monitor(entry.name, entry.path)
+                    self.process_monitor.add_addon_to_monitor(entry.name, entry.resolved_path)
                     self.running_addons[entry.name] = {
                         'process': process,
-                        'path': entry.path,
+                        'path': entry.resolved_path,
                         'auto_close': True
                     }
                     print(f"Added to auto-close monitoring: {entry.name} (PID: {process.pid})")
@@ -1158,19 +1237,12 @@ class MainWindow(QMainWindow):
         index = rows[0].row()
         entry = self.manager.entries[index]
 
-        dlg = AddEditDialog(self, "Modify Entry")
-        dlg.name_edit.setText(entry.name)
-        dlg.path_edit.setText(entry.path)
-        dlg.args_edit.setText(entry.args)
-        dlg.enabled_check.setChecked(entry.enabled)
-        dlg.auto_close_check.setChecked(entry.auto_close)
+        dlg = self._entry_dialog()
+        dlg.reset("Modify Entry", entry.name, entry.path, entry.args, entry.enabled, entry.auto_close)
 
         if dlg.exec():
             # Create backup before first modification if needed
-            if settings.is_first_time_using_file(self.manager.filepath, self.current_version):
-                backup_created, backup_path, error = settings.auto_backup_if_needed(self.manager.filepath, self.current_version)
-                if backup_created:
-                    self.update_status(f"Backup created: {os.path.basename(backup_path)}")
+            self._backup_before_first_change()
             
             # Remove old monitoring
             old_name = entry.name
@@ -1182,49 +1254,57 @@ class MainWindow(QMainWindow):
             self.manager.modify_entry(index, name, path, args, enabled, auto_close)
             
             # Add new monitoring if auto-close is enabled
-            if auto_close and os.path.exists(path):
-                self.process_monitor.add_addon_to_monitor(name, path)
+            exe_path = entry.resolved_path
+            if auto_close and os.path.exists(exe_path):
+                self.process_monitor.add_addon_to_monitor(name, exe_path)
                 print(f"Updated monitoring for {name}")
             
-            self.populate_table()
+            self.entries_model.refresh_row(index)
             self.update_status("Entry modified")
 
     # -------------------------
     # Preset Handling
     # -------------------------
     def refresh_presets(self):
-        preset_dir = settings.get_preset_dir(self.current_version)
-        self.preset_combo.clear()
-        
-        presets = [f[:-5] for f in os.listdir(preset_dir) if f.endswith(".json")]
-        if presets:
-            self.preset_combo.addItems(presets)
-        else:
-            self.preset_combo.addItem("No presets available")
-
-        s = settings.load_settings()
-        last = s.get(f"last_preset_{self.current_version}")
-        if last and last in presets:
-            self.preset_combo.setCurrentText(last)
+        preset_dir = self._preset_dir()
+        # The watcher drops a deleted folder; pick it up again once a save has recreated it
+        if preset_dir not in self.preset_watcher.directories() and os.path.isdir(preset_dir):
+            self.preset_watcher.addPath(preset_dir)
+        presets = settings.get_presets(self.current_version, preset_dir)
+        items = presets or ["No presets available"]
+        combo = self.preset_combo
+        
+        # Rebuild the combo in one batch without emitting per-item change signals,
+        # and not at all when the watcher fired but the list is unchanged (e.g. a preset overwritten)
+        # The user's current selection survives the rebuild; otherwise fall back to the last used preset
+        if [combo.itemText(i) for i in range(combo.count())] != items:
+            current = combo.currentText()
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItems(items)
+            last = self._settings.get(f"last_preset_{self.current_version}")
+            if current in presets:
+                combo.setCurrentText(current)
+            elif last and last in presets:
+                combo.setCurrentText(last)
+            combo.blockSignals(False)
 
     def load_preset_from_combo(self):
         name = self.preset_combo.currentText()
         if not name or name == "No presets available":
             return
         
-        preset_dir = settings.get_preset_dir(self.current_version)
-        path = os.path.join(preset_dir, name + ".json")
+        path = self._preset_path(name)
         
         try:
+            self._flush_pending_save()
             self.manager.load_preset(path)
             self.populate_table()
             
             # Update process monitoring after loading preset
             self.update_process_monitoring()
             
-            s = settings.load_settings()
-            s[f"last_preset_{self.current_version}"] = name
-            settings.save_settings(s)
+            self.set_setting(f"last_preset_{self.current_version}", name)
             self.update_status(f"Loaded preset: {name}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load preset: {str(e)}")
@@ -1237,15 +1317,14 @@ class MainWindow(QMainWindow):
         if not ok or not name.strip():
             return
         
-        preset_dir = settings.get_preset_dir(self.current_version)
-        path = os.path.join(preset_dir, name.strip() + ".json")
+        path = self._preset_path(name.strip())
         
         try:
             self.manager.save_preset(path)
-            s = settings.load_settings()
-            s[f"last_preset_{self.current_version}"] = name.strip()
-            settings.save_settings(s)
+            # Refresh now rather than waiting for the watcher, so the saved preset can be selected
             self.refresh_presets()
+            self.preset_combo.setCurrentText(name.strip())
+            self.set_setting(f"last_preset_{self.current_version}", name.strip())
             self.update_status(f"Saved preset: {name.strip()}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save preset: {str(e)}")
@@ -1358,12 +1437,11 @@ class MainWindow(QMainWindow):
         
         # Double-check that no auto-close processes are still running
         remaining_processes = 0
-        for entry in self.manager.entries:
-            if entry.auto_close and entry.enabled:
-                count = self.process_monitor.get_addon_process_count(entry.name)
-                remaining_processes += count
-                if count > 0:
-                    print(f"Warning: {entry.name} still has {count} running processes")
+        for addon_name in self.manager.auto_close_names():
+            count = self.process_monitor.get_addon_process_count(addon_name)
+            remaining_processes += count
+            if count > 0:
+                print(f"Warning: {addon_name} still has {count} running processes")
         
         if remaining_processes > 0:
             print(f"Warning: {remaining_processes} auto-close processes still running, extending delay...")
@@ -1404,7 +1482,7 @@ class MainWindow(QMainWindow):
                 if entry.name == addon_name:
                     self.running_addons[addon_name] = {
                         'process': None,  # We don't have the Process object
-                        'path': entry.path,
+                        'path': entry.resolved_path,
                         'auto_close': entry.auto_close
                     }
                     break
@@ -1422,7 +1500,7 @@ class MainWindow(QMainWindow):
         print("Auto-close entries:")
         for i, entry in enumerate(self.manager.entries):
             if entry.auto_close:
-                exists = os.path.exists(entry.path)
+                exists = os.path.exists(entry.resolved_path)
                 process_count = self.process_monitor.get_addon_process_count(entry.name)
                 print(f"  {i}: {entry.name}")
                 print(f"      Path: {entry.path}")
@@ -1444,8 +1522,6 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            import sys
-            
             # Get the current executable path
             if getattr(sys, 'frozen', False):
                 # Running as compiled executable
@@ -1457,32 +1533,32 @@ class MainWindow(QMainWindow):
                 app_path = f'"{python_exe}" "{script_path}"'
             
             # Check if entry already exists
-            for entry in self.manager.entries:
+            existing_index = None
+            for index, entry in enumerate(self.manager.entries):
                 if "Startup Manager" in entry.name and "background" in entry.args.lower():
-                    reply = QMessageBox.question(
-                        self,
-                        "Entry Exists",
-                        "An Startup Manager background entry already exists. Replace it?",
-                        QMessageBox.Yes | QMessageBox.No
-                    )
-                    if reply == QMessageBox.Yes:
-                        # Remove existing entry
-                        index = self.manager.entries.index(entry)
-                        self.manager.remove_entry(index)
-                    else:
-                        return
+                    existing_index = index
+                    break
+            
+            if existing_index is not None:
+                reply = QMessageBox.question(
+                    self,
+                    "Entry Exists",
+                    "An Startup Manager background entry already exists. Replace it?",
+                    QMessageBox.Yes | QMessageBox.No
+                )
+                if reply != QMessageBox.Yes:
+                    return
+                # Remove existing entry (through the model so the view drops the row too)
+                self.entries_model.remove_entry(existing_index)
             
             # Create backup before first modification if needed
-            if settings.is_first_time_using_file(self.manager.filepath, self.current_version):
-                backup_created, backup_path, error = settings.auto_backup_if_needed(self.manager.filepath, self.current_version)
-                if backup_created:
-                    self.update_status(f"Backup created: {os.path.basename(backup_path)}")
+            self._backup_before_first_change()
             
             # Add the entry
             entry_name = f"MSFS Startup Manager (Background)"
             args = "--start-background --auto-quit-after-autoclose"
             
-            self.manager.add_entry(
+            self.entries_model.append_entry(
                 name=entry_name,
                 path=app_path if getattr(sys, 'frozen', False) else python_exe,
                 args=args if getattr(sys, 'frozen', False) else f'{args}',
@@ -1490,7 +1566,6 @@ class MainWindow(QMainWindow):
                 auto_close=False  # Don't auto-close the manager itself
             )
             
-            self.populate_table()
             self.update_status("Added exe.xml Manager to startup")
             
             QMessageBox.information(
@@ -1536,8 +1611,7 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.Yes:
             try:
-                preset_dir = settings.get_preset_dir(self.current_version)
-                preset_path = os.path.join(preset_dir, current_preset + ".json")
+                preset_path = self._preset_path(current_preset)
                 
                 self.manager.save_preset(preset_path)
                 self.update_status(f"Updated preset: {current_preset}")
@@ -1573,11 +1647,10 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.Yes:
             try:
-                preset_dir = settings.get_preset_dir(self.current_version)
-                preset_path = os.path.join(preset_dir, current_preset + ".json")
+                preset_path = self._preset_path(current_preset)
                 
                 if os.path.exists(preset_path):
-                    os.remove(preset_path)
+                    ExeXmlManager.delete_preset(preset_path)
                     
                     # Refresh the combo box
                     self.refresh_presets()
@@ -1625,9 +1698,8 @@ class MainWindow(QMainWindow):
         new_name = new_name.strip()
         
         try:
-            preset_dir = settings.get_preset_dir(self.current_version)
-            current_path = os.path.join(preset_dir, current_preset + ".json")
-            new_path = os.path.join(preset_dir, new_name + ".json")
+            current_path = self._preset_path(current_preset)
+            new_path = self._preset_path(new_name)
             
             # Check if source preset exists
             if not os.path.exists(current_path):
@@ -1650,25 +1722,15 @@ class MainWindow(QMainWindow):
                 if reply != QMessageBox.Yes:
                     return
             
-            # Read the current preset and create duplicate
-            with open(current_path, 'r', encoding='utf-8') as f:
-                preset_data = json.load(f)
-            
-            # Update the name in the duplicated preset
-            preset_data["name"] = new_name
-            
-            # Save the duplicate
-            with open(new_path, 'w', encoding='utf-8') as f:
-                json.dump(preset_data, f, indent=2)
+            # Save the duplicate under its new name
+            ExeXmlManager.duplicate_preset(current_path, new_path, new_name)
             
             # Refresh the combo box and select the new preset
             self.refresh_presets()
             self.preset_combo.setCurrentText(new_name)
             
             # Save as last used preset
-            s = settings.load_settings()
-            s[f"last_preset_{self.current_version}"] = new_name
-            settings.save_settings(s)
+            self.set_setting(f"last_preset_{self.current_version}", new_name)
             
             self.update_status(f"Duplicated preset: {current_preset} → {new_name}")
             
@@ -1683,7 +1745,11 @@ class MainWindow(QMainWindow):
 
     def get_vs_dark_stylesheet(self):
         """Visual Studio Dark theme colors"""
-        return """
+        return _VS_DARK_QSS
+
+
+# Visual Studio Dark theme colors, shared by every MainWindow
+_VS_DARK_QSS = """
         QMainWindow {
             background-color: #1e1e1e;
             color: #cccccc;
@@ -1845,7 +1911,7 @@ class MainWindow(QMainWindow):
             background-color: #2a2d2e;
         }
         
-        QTableWidget#modernTable {
+        QTableView#modernTable {
             background-color: #252526;
             gridline-color: #3e3e42;
             border: 1px solid #3e3e42;
@@ -1854,18 +1920,18 @@ class MainWindow(QMainWindow):
             selection-color: #ffffff;
         }
         
-        QTableWidget#modernTable::item {
+        QTableView#modernTable::item {
             padding: 8px;
             border: none;
             color: #cccccc;
         }
         
-        QTableWidget#modernTable::item:selected {
+        QTableView#modernTable::item:selected {
             background-color: #094771;
             color: #ffffff;
         }
         
-        QTableWidget#modernTable::item:alternate {
+        QTableView#modernTable::item:alternate {
             background-color: #2a2a2b;
         }
         
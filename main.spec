@@ -18,7 +18,7 @@ a = Analysis(
         'PySide6.QtCore',
         'PySide6.QtGui', 
         'PySide6.QtWidgets',
-        'xml.etree.ElementTree',
+        'lxml.etree',
         'json',
         'subprocess',
         'os',
@@ -1,6 +1,7 @@
 from PIL import Image
 import sys
 import os
+import math
 
 def png_to_ico(png_path, ico_path=None, sizes=[(16,16), (32,32), (48,48), (64,64), (128,128), (256,256)]):
     if not os.path.exists(png_path):
@@ -11,7 +12,19 @@ def png_to_ico(png_path, ico_path=None, sizes=[(16,16), (32,32), (48,48), (64,64
         ico_path = os.path.splitext(png_path)[0] + ".ico"
 
     img = Image.open(png_path).convert("RGBA")
-    img.save(ico_path, format="ICO", sizes=sizes)
+
+    # Every ICO frame is resampled from the source, so shrink large sources once up front -
+    # but only as far as both sides still cover the biggest frame, or non-square images lose it
+    max_w = max(w for w, _ in sizes)
+    max_h = max(h for _, h in sizes)
+    scale = max(max_w / img.width, max_h / img.height)
+    if scale < 1:
+        img = img.resize(
+            (math.ceil(img.width * scale), math.ceil(img.height * scale)), Image.LANCZOS
+        )
+
+    # Store frames as uncompressed BMP rather than deflate-compressed PNG
+    img.save(ico_path, format="ICO", sizes=sizes, bitmap_format="bmp")
     print(f"✅ Saved icon as {ico_path}")
 
 if __name__ == "__main__":
@@ -1,9 +1,19 @@
 import os
 import json
+import copy
+import shutil
+from datetime import datetime
+from functools import lru_cache
 
 APP_DIR = os.path.join(os.getenv("APPDATA"), "MSFSExeXmlManager")
 SETTINGS_FILE = os.path.join(APP_DIR, "settings.json")
 
+# Default per-simulator folders (Steam layout), expanded once per session
+DEFAULT_SIM_DIRS = {
+    "MSFS2020": os.path.expandvars(r"%APPDATA%\Microsoft Flight Simulator"),
+    "MSFS2024": os.path.expandvars(r"%APPDATA%\Microsoft Flight Simulator 2024"),
+}
+
 
 def get_preset_dir(sim_version: str):
     """
@@ -15,19 +25,75 @@ def get_preset_dir(sim_version: str):
     return path
 
 
+# preset_dir -> (directory mtime_ns, sorted preset names)
+_preset_list_cache = {}
+
+
+def get_presets(sim_version: str, preset_dir=None):
+    """
+    List the preset names saved for a simulator version.
+    
+    Args:
+        sim_version: "MSFS2020" or "MSFS2024"
+        preset_dir: Already-resolved preset directory (skips get_preset_dir)
+    
+    Returns:
+        list: Preset names (file names without the .json extension), sorted case-insensitively
+    """
+    preset_dir = preset_dir or get_preset_dir(sim_version)
+    # Adding, removing or renaming a preset bumps the directory mtime, so an unchanged
+    # mtime means the previous scan is still valid
+    try:
+        mtime = os.stat(preset_dir).st_mtime_ns
+    except FileNotFoundError:
+        # Folder deleted while running; it is recreated on the next preset save
+        _preset_list_cache.pop(preset_dir, None)
+        return []
+    cached = _preset_list_cache.get(preset_dir)
+    if cached is not None and cached[0] == mtime:
+        return list(cached[1])
+    
+    with os.scandir(preset_dir) as it:
+        names = [e.name[:-5] for e in it if e.name.endswith(".json") and e.is_file()]
+    names.sort(key=str.lower)
+    _preset_list_cache[preset_dir] = (mtime, names)
+    return list(names)
+
+
+# Last parsed settings.json, keyed by the file's (mtime_ns, size) so it is only re-read on change
+_settings_cache = None
+
+
+def _settings_stamp():
+    try:
+        st = os.stat(SETTINGS_FILE)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def load_settings():
-    """Load settings.json as dict."""
-    if os.path.exists(SETTINGS_FILE):
+    """Load settings.json as dict (a private copy; re-parsed only when the file changed)."""
+    global _settings_cache
+    stamp = _settings_stamp()
+    if stamp is None:
+        return {}
+    if _settings_cache is None or _settings_cache[0] != stamp:
         with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+            _settings_cache = (stamp, json.load(f))
+    return copy.deepcopy(_settings_cache[1])
 
 
 def save_settings(data: dict):
     """Save settings dict to settings.json."""
+    global _settings_cache
     os.makedirs(APP_DIR, exist_ok=True)
-    with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
+    # Write to a temp file and swap it in so a crash mid-write can't truncate settings.json
+    tmp_file = SETTINGS_FILE + ".tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
+    os.replace(tmp_file, SETTINGS_FILE)
+    _settings_cache = (_settings_stamp(), copy.deepcopy(data))
 
 
 def auto_detect_exe_xml(sim_version: str):
@@ -125,6 +191,7 @@ def get_all_detected_paths(sim_version: str):
     return detected_paths
 
 
+@lru_cache(maxsize=32)
 def get_installation_type(path: str):
     """
     Determine the installation type based on the exe.xml path.
@@ -176,14 +243,12 @@ def create_backup(exe_xml_path: str, sim_version: str):
     backup_dir = get_backup_dir(sim_version)
     
     # Generate backup filename with timestamp
-    from datetime import datetime
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     install_type = get_installation_type(exe_xml_path).replace(" ", "_").replace("(", "").replace(")", "")
     backup_filename = f"exe_xml_backup_{install_type}_{timestamp}.xml"
     backup_path = os.path.join(backup_dir, backup_filename)
     
     try:
-        import shutil
         shutil.copy2(exe_xml_path, backup_path)
         return backup_path
     except Exception as e:
@@ -34,9 +34,9 @@ class AddEditDialog(QDialog):
         layout.setContentsMargins(32, 32, 32, 32)
         
         # Title
-        title_label = QLabel(title)
-        title_label.setObjectName("dialogTitle")
-        layout.addWidget(title_label)
+        self.title_label = QLabel(title)
+        self.title_label.setObjectName("dialogTitle")
+        layout.addWidget(self.title_label)
         
         # Form fields
         form_layout = self.create_form()
@@ -286,6 +286,17 @@ class AddEditDialog(QDialog):
         # If all else fails, return the filename
         return os.path.basename(file_path)
 
+    def reset(self, title="Add Entry", name="", path="", args="", enabled=True, auto_close=False):
+        """Retitle and refill the form so one dialog instance can be reused for add and modify"""
+        self.setWindowTitle(title)
+        self.title_label.setText(title)
+        self.name_edit.setText(name)
+        self.path_edit.setText(path)
+        self.args_edit.setText(args)
+        self.enabled_check.setChecked(enabled)
+        self.auto_close_check.setChecked(auto_close)
+        self.name_edit.setFocus()
+
     def get_data(self):
         # Returns 5 values including auto_close
         return (
@@ -298,7 +309,11 @@ class AddEditDialog(QDialog):
 
     def get_vs_dark_dialog_stylesheet(self):
         """Visual Studio Dark theme for dialogs"""
-        return """
+        return _VS_DARK_DIALOG_QSS
+
+
+# Visual Studio Dark theme for dialogs, shared by every AddEditDialog
+_VS_DARK_DIALOG_QSS = """
         QDialog {
             background-color: #2d2d30;
             color: #cccccc;
@@ -468,4 +483,4 @@ class AddEditDialog(QDialog):
         QFileDialog QPushButton:hover {
             background-color: #464647;
         }
-        """
\ No newline at end of file
+        """
@@ -0,0 +1,105 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+
+# Qt enum values looked up once; data()/flags() run for every visible cell and role on each paint
+_DISPLAY_ROLE = Qt.DisplayRole
+_CHECK_STATE_ROLE = Qt.CheckStateRole
+_TOOLTIP_ROLE = Qt.ToolTipRole
+_ALIGNMENT_ROLE = Qt.TextAlignmentRole
+_CHECKED, _UNCHECKED = Qt.Checked, Qt.Unchecked
+_ALIGN_CENTER = Qt.AlignCenter
+_CHECK_FLAGS = Qt.ItemIsUserCheckable | Qt.ItemIsEnabled
+_TEXT_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+_AUTO_CLOSE_TOOLTIP = "Automatically close this addon when the simulator stops"
+
+
+class EntriesModel(QAbstractTableModel):
+    """Table model over ExeXmlManager.entries; Qt only asks for the rows it paints"""
+
+    HEADERS = ["Enabled", "Name", "Path", "Arguments", "Auto-Close"]
+    ENABLED_COLUMN = 0
+    AUTO_CLOSE_COLUMN = 4
+
+    # row, column, checked - emitted when the user toggles one of the checkbox columns
+    checkToggled = Signal(int, int, bool)
+
+    def __init__(self, manager, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+
+    def reset(self):
+        """Re-read every entry after a bulk change (load, preset, ...)"""
+        self.beginResetModel()
+        self.endResetModel()
+
+    # -------------------------
+    # Mutations routed through the model so views get row-level signals
+    # -------------------------
+    def append_entry(self, name, path, args, enabled, auto_close=False):
+        row = len(self.manager.entries)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.manager.add_entry(name, path, args, enabled, auto_close)
+        self.endInsertRows()
+
+    def remove_entry(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.manager.remove_entry(row)
+        self.endRemoveRows()
+
+    def refresh_row(self, row):
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    # -------------------------
+    # QAbstractTableModel interface
+    # -------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.manager.entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.manager.entries[index.row()]
+        column = index.column()
+
+        if column == 0 or column == 4:  # Enabled / Auto-Close checkboxes
+            if role == _CHECK_STATE_ROLE:
+                value = entry.enabled if column == 0 else entry.auto_close
+                return _CHECKED if value else _UNCHECKED
+            if role == _ALIGNMENT_ROLE:
+                return _ALIGN_CENTER
+            if role == _TOOLTIP_ROLE and column == 4:
+                return _AUTO_CLOSE_TOOLTIP
+            return None
+
+        if role == _DISPLAY_ROLE:
+            if column == 1:
+                return entry.name
+            if column == 2:
+                return entry.path
+            return entry.args
+        if role == _TOOLTIP_ROLE and column == 2:
+            return entry.path
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        column = index.column()
+        if role != Qt.CheckStateRole or column not in (self.ENABLED_COLUMN, self.AUTO_CLOSE_COLUMN):
+            return False
+        # PySide6 hands check states over as ints
+        checked = Qt.CheckState(value) == Qt.Checked
+        self.checkToggled.emit(index.row(), column, checked)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        column = index.column()
+        return _CHECK_FLAGS if column == 0 or column == 4 else _TEXT_FLAGS